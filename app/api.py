@@ -11,11 +11,11 @@ from app.config import settings
 from app.db import AIPlan, SessionLocal, User
 from app.plan_completion.cta import get_next_plan_recommendation
 from app.plan_completion.metrics import build_completion_metrics
-from app.plan_completion.pulse import build_pulse_data
+from app.plan_completion.pulse import build_pulse_data, resolve_persona
 from app.plan_completion.report import _pick_observation, build_completion_report
 from app.plan_completion.timeline import get_plan_timeline
 from app.plan_completion.tokens import verify_report_token
-from app.scheduler import cancel_plan_step_jobs, reschedule_plan_steps
+from app.scheduler import mutate_plan_step_jobs
 from app.time_slots import TimeSlotError, update_user_time_slots
 
 app = FastAPI()
@@ -109,8 +109,7 @@ def set_user_time_slots(
             raise HTTPException(status_code=400, detail=str(exc)) from exc
         db.commit()
 
-    cancel_plan_step_jobs(active_step_ids)
-    reschedule_plan_steps(active_step_ids)
+    mutate_plan_step_jobs(active_step_ids, active_step_ids)
 
     return {"updated_steps": len(updated_step_ids)}
 
@@ -136,9 +135,7 @@ async def completion_report(request: Request, token: str):
         except Exception:
             return HTMLResponse("<h1>Дані плану недоступні.</h1>", status_code=404)
 
-        persona = "empath"
-        if isinstance(user.profile, dict):
-            persona = user.profile.get("persona", "empath")
+        persona = resolve_persona(user)
 
         report_text = build_completion_report(metrics, persona)
         observation = _pick_observation(metrics)
@@ -19,7 +19,7 @@ def _normalize_payload(raw: dict) -> dict:
 def load_content_library(db: Session, source_path: str | Path) -> int:
     """Load or refresh the content library entries from JSON."""
     path = Path(source_path)
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = json.loads(path.read_bytes())
     inventory: Iterable[dict] = data.get("inventory", [])
     updated = 0
 
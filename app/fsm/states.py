@@ -12,8 +12,16 @@ Active FSM (9 state groups):
 
 from __future__ import annotations
 
+IDLE_NEW = "IDLE_NEW"
+IDLE_FINISHED = "IDLE_FINISHED"
+IDLE_DROPPED = "IDLE_DROPPED"
+ACTIVE = "ACTIVE"
+ACTIVE_PAUSED = "ACTIVE_PAUSED"
 SCHEDULE_ADJUSTMENT = "SCHEDULE_ADJUSTMENT"
 
+# Prefix of the ONBOARDING:* wildcard family (see PREFIXED_STATES).
+ONBOARDING_PREFIX = "ONBOARDING:"
+
 SCHEDULE_ADJUSTMENT_ALLOWED_TRANSITIONS = {
     ("ACTIVE", SCHEDULE_ADJUSTMENT),
     ("ACTIVE_PAUSED", SCHEDULE_ADJUSTMENT),
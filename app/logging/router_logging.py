@@ -1,7 +1,12 @@
+import atexit
 import json
 import logging
+import queue
 import sys
-from typing import Any, Dict
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger("router")
 logger.setLevel(logging.INFO)
@@ -16,15 +21,23 @@ if not logger.handlers:
 # Avoid duplicate messages from the root logger.
 logger.propagate = False
 
+# Records are serialized and written by a daemon thread so request handlers never
+# block on stdout. When the queue is full new records are dropped (backpressure).
+_LOG_QUEUE_MAXSIZE = 10_000
+# Each record is (created_at, metric_name, value, extra); the payload dict is built by the worker.
+_MetricRecord = Tuple[float, str, int, Optional[Dict[str, Any]]]
+_log_queue: "queue.Queue[_MetricRecord]" = queue.Queue(maxsize=_LOG_QUEUE_MAXSIZE)
+_worker_lock = threading.Lock()
+_worker: threading.Thread | None = None
+# log_metric runs on the event loop and on scheduler threads; the worker swaps
+# the counter, so both sides go through this lock.
+_dropped_lock = threading.Lock()
+_dropped_records = 0
 
-def _emit(data: Dict[str, Any]) -> None:
-    try:
-        logger.info(json.dumps(data, ensure_ascii=False))
-    except Exception:
-        logger.info(str(data))
 
-
-def log_metric(metric_name: str, value: int = 1, extra: Dict[str, Any] | None = None) -> None:
+def _build_payload(record: _MetricRecord) -> Dict[str, Any]:
+    # The caller only captured time.time(); formatting happens here, off the request path.
+    created_at, metric_name, value, extra = record
     payload: Dict[str, Any] = {
         "event_type": "metric",
         "metric_name": metric_name,
@@ -32,4 +45,71 @@ def log_metric(metric_name: str, value: int = 1, extra: Dict[str, Any] | None =
     }
     if extra:
         payload.update(extra)
-    _emit(payload)
+    payload.setdefault(
+        "timestamp",
+        datetime.fromtimestamp(created_at, timezone.utc).replace(tzinfo=None).isoformat(),
+    )
+    return payload
+
+
+def _write(record: _MetricRecord) -> None:
+    data = _build_payload(record)
+    try:
+        logger.info(json.dumps(data, ensure_ascii=False))
+    except Exception:
+        logger.info(str(data))
+
+
+def _write_safely(record: _MetricRecord) -> None:
+    # A bad record must not kill the worker: nothing restarts it, and every
+    # later metric would then just pile up in the queue and be dropped.
+    try:
+        _write(record)
+    except Exception:
+        logger.warning("Failed to write router metric %r", record[1], exc_info=True)
+
+
+def _drain_forever() -> None:
+    global _dropped_records
+    while True:
+        record = _log_queue.get()
+        try:
+            _write_safely(record)
+            if _dropped_records:
+                with _dropped_lock:
+                    dropped, _dropped_records = _dropped_records, 0
+                logger.warning("Dropped %d router log records (queue full)", dropped)
+        finally:
+            _log_queue.task_done()
+
+
+def _flush() -> None:
+    while True:
+        try:
+            record = _log_queue.get_nowait()
+        except queue.Empty:
+            return
+        _write_safely(record)
+        _log_queue.task_done()
+
+
+def _ensure_worker() -> None:
+    global _worker
+    if _worker is not None:
+        return
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_drain_forever, name="router-log", daemon=True)
+            _worker.start()
+            atexit.register(_flush)
+
+
+def log_metric(metric_name: str, value: int = 1, extra: Dict[str, Any] | None = None) -> None:
+    """Fire-and-forget: enqueue the raw record and return; never blocks the caller."""
+    global _dropped_records
+    _ensure_worker()
+    try:
+        _log_queue.put_nowait((time.time(), metric_name, value, extra))
+    except queue.Full:
+        with _dropped_lock:
+            _dropped_records += 1
@@ -18,7 +18,8 @@ from app.telegram import bot, dp
 async def main() -> None:
     init_db()
     audit_startup_schema()
-    asyncio.create_task(schedule_daily_loop())
+    # Keep a reference so the loop task is not garbage-collected while polling runs.
+    scheduler_task = asyncio.create_task(schedule_daily_loop())  # noqa: F841
 
     config = uvicorn.Config(app, host="0.0.0.0", port=8000, log_level="info")
     server = uvicorn.Server(config)
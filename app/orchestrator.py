@@ -1,13 +1,16 @@
 import asyncio
+import sys
 from datetime import date, datetime, time, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import logging
 
 import pytz
 from pydantic import ValidationError
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.config import settings
 from app.db import (
@@ -24,8 +27,12 @@ from app.db import (
 )
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from app.logging.router_logging import log_metric
-from app.plan_adaptations import PlanAdaptationError, apply_plan_adaptation
-from app.scheduler import cancel_plan_step_jobs, reschedule_plan_steps
+from app.plan_adaptations import (
+    PlanAdaptationError,
+    PlanAdaptationResult,
+    apply_plan_adaptation,
+)
+from app.scheduler import cancel_plan_step_jobs, mutate_plan_step_jobs, reschedule_plan_steps
 from app.redis_client import redis_client
 from app.session_memory import SessionMemory
 from app.time_slots import compute_scheduled_for, resolve_daily_time_slots
@@ -44,8 +51,14 @@ from app.plan_finalization import (
 from app.workers.coach_agent import _build_idle_finished_context, coach_agent
 from app.fsm.guards import can_transition
 from app.fsm.states import (
+    ACTIVE,
+    ACTIVE_PAUSED,
     FSM_ALLOWED_STATES,
+    IDLE_DROPPED,
+    IDLE_FINISHED,
+    IDLE_NEW,
     IDLE_STATES,
+    ONBOARDING_PREFIX,
     PLAN_CREATION_ENTRY_STATES,
     SCHEDULE_ADJUSTMENT,
 )
@@ -60,6 +73,9 @@ from app.telemetry import log_user_event
 session_memory = SessionMemory(limit=20)
 logger = logging.getLogger(__name__)
 
+# Strong references to fire-and-forget tasks; the event loop only keeps weak ones.
+_background_tasks: Set[asyncio.Task] = set()
+
 
 class PlanAgentEnvelopeError(ValueError):
     """Raised when a generated plan payload is structurally invalid."""
@@ -72,8 +88,13 @@ PLAN_GENERATION_ERROR_MESSAGE = (
     "⚠️ Не вдалося згенерувати план.\nСпробуй ще раз або зміни параметри."
 )
 PLAN_FINALIZATION_ERROR_MESSAGE = "⚠️ Не вдалося активувати план."
-PLAN_DURATION_VALUES = {"SHORT", "MEDIUM", "STANDARD", "LONG"}
-PLAN_LOAD_VALUES = {"LITE", "MID", "INTENSIVE"}
+PLAN_DURATION_VALUES = frozenset({"SHORT", "MEDIUM", "STANDARD", "LONG"})
+PLAN_LOAD_VALUES = frozenset({"LITE", "MID", "INTENSIVE"})
+_ALLOWED_EXECUTION_ADAPTATIONS = frozenset({"pause", "resume", "PAUSE_PLAN", "RESUME_PLAN"})
+_STEP_TYPE_VALUES = frozenset(entry.value for entry in StepType)
+_DIFFICULTY_VALUES = frozenset(entry.value for entry in DifficultyLevel)
+
+_PLAN_RUNNING_STATES = frozenset({ACTIVE, ACTIVE_PAUSED})
 
 SLOT_RANGES = {
     "DAY": (time(12, 0), time(17, 59)),
@@ -144,6 +165,11 @@ def _expected_time_slots_for_load(load: str | None) -> int | None:
     return None
 
 
+def _reply_text_of(result: Dict[str, Any]) -> str:
+    value = result.get("reply_text")
+    return str(value) if value else ""
+
+
 def _plan_agent_fallback_envelope() -> Dict[str, Any]:
     return {
         "reply_text": PLAN_GENERATION_ERROR_MESSAGE,
@@ -177,9 +203,9 @@ async def _handle_schedule_adjustment_init(user_id: int, tool_args: Dict[str, An
     if not active_tasks:
         return {"user_text": "Немає майбутніх завдань для зміни часу."}
 
-    first_slot = list(active_tasks.keys())[0]
+    first_slot = next(iter(active_tasks))
     is_single = len(active_tasks) == 1
-    is_paused = user.current_state == "ACTIVE_PAUSED"
+    is_paused = user.current_state == ACTIVE_PAUSED
 
     await _commit_fsm_transition(
         user_id=user_id,
@@ -197,8 +223,10 @@ async def _handle_schedule_adjustment_init(user_id: int, tool_args: Dict[str, An
         "step": "time_select" if is_single else "task_select",
         "plan_was_paused": is_paused,
     }
-    await session_memory.set_schedule_adjustment_context(user_id, ctx)
-    await session_memory.set_schedule_adjustment_last_active(user_id)
+    await asyncio.gather(
+        session_memory.set_schedule_adjustment_context(user_id, ctx),
+        session_memory.set_schedule_adjustment_last_active(user_id),
+    )
 
     keyboard = _build_time_select_keyboard(first_slot, active_tasks[first_slot], in_multi=False) if is_single else _build_task_select_keyboard(active_tasks)
     return {"user_text": tool_args.get("user_text", ""), "keyboard": keyboard}
@@ -244,16 +272,17 @@ async def _handle_schedule_adjustment_record(user_id: int, tool_args: Dict[str,
     queue = [s for s in ctx.get("slots_queue", []) if s != slot_being_edited]
     next_slot = queue[0] if queue else None
 
-    await session_memory.update_schedule_adjustment_context(
-        user_id,
+    # ctx was fetched above; write it back directly instead of a second read-modify-write.
+    ctx.update(
         {
             "active_tasks": active_tasks,
             "pending_changes": pending,
             "slots_queue": queue,
             "current_slot": next_slot,
             "step": "time_select" if next_slot else "awaiting_apply",
-        },
+        }
     )
+    await session_memory.set_schedule_adjustment_context(user_id, ctx)
     await session_memory.set_schedule_adjustment_last_active(user_id)
 
     if next_slot:
@@ -262,6 +291,23 @@ async def _handle_schedule_adjustment_record(user_id: int, tool_args: Dict[str,
     return {"user_text": user_text}
 
 
+async def _return_from_schedule_adjustment(
+    user_id: int,
+    db: Session,
+    *,
+    plan_was_paused: bool,
+    reason: str,
+) -> None:
+    """Transition back to the plan state the adjustment flow was entered from."""
+    await _commit_fsm_transition(
+        user_id=user_id,
+        agent="plan",
+        next_state=ACTIVE_PAUSED if plan_was_paused else ACTIVE,
+        db=db,
+        reason=reason,
+    )
+
+
 async def _handle_schedule_adjustment_apply(user_id: int, tool_args: Dict[str, Any], db: Session) -> Dict[str, Any]:
     ctx = await session_memory.get_schedule_adjustment_context(user_id) or {}
     plan_was_paused = bool(ctx.get("plan_was_paused", False))
@@ -269,32 +315,22 @@ async def _handle_schedule_adjustment_apply(user_id: int, tool_args: Dict[str, A
     user = db.query(User).filter(User.id == user_id).first()
     active_plan = get_active_plan(db, user_id)
     if not user or not active_plan:
-        return_state = "ACTIVE_PAUSED" if plan_was_paused else "ACTIVE"
-        await _commit_fsm_transition(
-            user_id=user_id,
-            agent="plan",
-            next_state=return_state,
-            db=db,
-            reason="no_plan",
+        await _return_from_schedule_adjustment(
+            user_id, db, plan_was_paused=plan_was_paused, reason="no_plan"
         )
         return {"user_text": "Активний план не знайдено."}
 
     pending_changes = ctx.get("pending_changes", {})
     if not pending_changes:
-        return_state = "ACTIVE_PAUSED" if plan_was_paused else "ACTIVE"
-        await _commit_fsm_transition(
-            user_id=user_id,
-            agent="plan",
-            next_state=return_state,
-            db=db,
-            reason="no_changes",
+        await _return_from_schedule_adjustment(
+            user_id, db, plan_was_paused=plan_was_paused, reason="no_changes"
         )
         await session_memory.clear_schedule_adjustment_context(user_id)
         return {"user_text": tool_args.get("user_text", "Нічого не змінилось.")}
 
     current_day = getattr(active_plan, "current_day", 1) or 1
     now_utc = datetime.now(timezone.utc)
-    daily_time_slots = dict(resolve_daily_time_slots(user.profile))
+    daily_time_slots = resolve_daily_time_slots(user.profile)
     telemetry_changes = []
     step_ids_to_reschedule: List[int] = []
 
@@ -371,17 +407,10 @@ async def _handle_schedule_adjustment_apply(user_id: int, tool_args: Dict[str, A
         except Exception:
             logger.exception("[SCHED_ADJ] reschedule failed user=%s", user_id)
 
-    return_state = "ACTIVE_PAUSED" if plan_was_paused else "ACTIVE"
-    await _commit_fsm_transition(
-        user_id=user_id,
-        agent="plan",
-        next_state=return_state,
-        db=db,
-        reason="schedule_adjustment_applied",
+    await _return_from_schedule_adjustment(
+        user_id, db, plan_was_paused=plan_was_paused, reason="schedule_adjustment_applied"
     )
-    await session_memory.clear_schedule_adjustment_context(user_id)
-    await session_memory.clear_schedule_adjustment_last_active(user_id)
-    await session_memory.clear_schedule_adjustment_soft_prompted(user_id)
+    await session_memory.clear_schedule_adjustment_session(user_id)
 
     return {"user_text": tool_args.get("user_text", "Готово ✅")}
 
@@ -389,18 +418,11 @@ async def _handle_schedule_adjustment_apply(user_id: int, tool_args: Dict[str, A
 async def _handle_schedule_adjustment_cancel(user_id: int, tool_args: Dict[str, Any], db: Session) -> Dict[str, Any]:
     ctx = await session_memory.get_schedule_adjustment_context(user_id) or {}
     plan_was_paused = bool(ctx.get("plan_was_paused", False))
-    return_state = "ACTIVE_PAUSED" if plan_was_paused else "ACTIVE"
 
-    await _commit_fsm_transition(
-        user_id=user_id,
-        agent="plan",
-        next_state=return_state,
-        db=db,
-        reason="schedule_adjustment_cancelled",
+    await _return_from_schedule_adjustment(
+        user_id, db, plan_was_paused=plan_was_paused, reason="schedule_adjustment_cancelled"
     )
-    await session_memory.clear_schedule_adjustment_context(user_id)
-    await session_memory.clear_schedule_adjustment_last_active(user_id)
-    await session_memory.clear_schedule_adjustment_soft_prompted(user_id)
+    await session_memory.clear_schedule_adjustment_session(user_id)
     return {"user_text": tool_args.get("user_text", "Добре, залишаємо як є.")}
 
 
@@ -446,7 +468,8 @@ def _normalize_fsm_state(raw_state: Optional[str]) -> Optional[str]:
         normalized = state.upper()
     if normalized not in FSM_ALLOWED_STATES:
         return None
-    return normalized
+    # Interned so later comparisons against the state constants hit the identity fast path.
+    return sys.intern(normalized)
 
 
 def _guard_fsm_transition(
@@ -457,7 +480,20 @@ def _guard_fsm_transition(
 ) -> Tuple[Optional[str], Optional[str]]:
     if transition_signal is None:
         return None, None
+    if not isinstance(transition_signal, str):
+        return None, "invalid_state"
+    if current_state is not None and not isinstance(current_state, str):
+        current_state = None
+
+    return _resolve_fsm_transition(current_state, transition_signal)
+
 
+@lru_cache(maxsize=1024)
+def _resolve_fsm_transition(
+    current_state: Optional[str],
+    transition_signal: str,
+) -> Tuple[Optional[str], Optional[str]]:
+    """Pure guard outcome for (state, signal); the FSM table is static, so results are cached."""
     normalized_current = _normalize_fsm_state(current_state) if current_state else None
 
     normalized_signal = _normalize_fsm_state(transition_signal)
@@ -513,7 +549,7 @@ def _auto_complete_plan_if_needed(db: Session, user: User) -> None:
     # IDEMPOTENCY GUARD
     if plan is None or plan.status == "completed":
         if user.current_state not in IDLE_STATES:
-            user.current_state = "IDLE_FINISHED"
+            user.current_state = IDLE_FINISHED
         user.plan_end_date = None
         db.add(user)
         return
@@ -522,7 +558,7 @@ def _auto_complete_plan_if_needed(db: Session, user: User) -> None:
     plan.end_date = now
     db.add(plan)
 
-    user.current_state = "IDLE_FINISHED"
+    user.current_state = IDLE_FINISHED
     user.plan_end_date = None
     db.add(user)
 
@@ -558,14 +594,16 @@ def _auto_complete_plan_if_needed(db: Session, user: User) -> None:
         db.rollback()
         plan.status = "completed"
         plan.end_date = now
-        user.current_state = "IDLE_FINISHED"
+        user.current_state = IDLE_FINISHED
         user.plan_end_date = None
         db.add(plan)
         db.add(user)
 
     try:
         asyncio.get_running_loop()
-        asyncio.create_task(send_plan_completion_message(user.id, plan.id))
+        task = asyncio.create_task(send_plan_completion_message(user.id, plan.id))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
     except RuntimeError:
         logger.warning(
             "[COMPLETION] No running event loop, skipping message task user=%s",
@@ -638,14 +676,13 @@ async def send_plan_completion_message(user_id: int, plan_id: int) -> None:
     result = await _send_message_async(tg_id, report_text, reply_markup=keyboard)
 
     if result:
-        with SessionLocal() as db:
+        with SessionLocal.begin() as db:
             log_user_event(
                 db,
                 user_id=user_id,
                 event_type="plan_completion_sent",
                 context={"plan_id": plan_id, "outcome_tier": metrics.outcome_tier},
             )
-            db.commit()
         return
 
     _schedule_completion_retry(user_id, plan_id)
@@ -682,7 +719,7 @@ async def _send_failure_notice(user_id: int) -> None:
     from app.scheduler import _send_message_async
 
     with SessionLocal() as db:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if user and user.tg_id:
             await _send_message_async(
                 user.tg_id,
@@ -699,7 +736,7 @@ def _trigger_plan_completion(user_id: int, plan_id: int) -> None:
     from app.scheduler import _submit_coroutine
 
     with SessionLocal() as db:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
             return
         _auto_complete_plan_if_needed(db, user)
@@ -720,7 +757,17 @@ def _trigger_plan_completion(user_id: int, plan_id: int) -> None:
 
 def _auto_complete_plan_if_needed_for_user_id(user_id: int) -> None:
     with SessionLocal() as db:
-        user: Optional[User] = db.query(User).filter(User.id == user_id).first()
+        # Only materialize the user when the plan end date has already passed;
+        # for every other message the filtered lookup returns no row.
+        user: Optional[User] = (
+            db.query(User)
+            .filter(
+                User.id == user_id,
+                User.plan_end_date.isnot(None),
+                User.plan_end_date < datetime.now(timezone.utc),
+            )
+            .first()
+        )
         if not user:
             return
 
@@ -738,44 +785,41 @@ def _auto_complete_plan_if_needed_for_user_id(user_id: int) -> None:
 
 
 def _auto_drop_plan_for_new_flow(user_id: int) -> bool:
-    with SessionLocal() as db:
-        user: Optional[User] = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return False
-        if user.current_state not in {"ACTIVE", "ACTIVE_PAUSED"}:
-            return False
-
-        active_plan = (
-            db.query(AIPlan)
-            .filter(AIPlan.user_id == user_id, AIPlan.status == "active")
-            .order_by(AIPlan.created_at.desc())
-            .first()
-        )
-
-        step_ids: List[int] = []
-        if active_plan:
-            step_rows = (
-                db.query(AIPlanStep.id)
-                .join(AIPlanDay, AIPlanDay.id == AIPlanStep.day_id)
-                .filter(AIPlanDay.plan_id == active_plan.id)
-                .all()
+    step_ids: List[int] = []
+    try:
+        with SessionLocal.begin() as db:
+            user: Optional[User] = db.get(User, user_id)
+            if not user:
+                return False
+            if user.current_state not in _PLAN_RUNNING_STATES:
+                return False
+
+            active_plan = (
+                db.query(AIPlan)
+                .filter(AIPlan.user_id == user_id, AIPlan.status == "active")
+                .order_by(AIPlan.created_at.desc())
+                .first()
             )
-            step_ids = [row[0] for row in step_rows]
-            active_plan.status = "abandoned"
-            active_plan.end_date = datetime.now(timezone.utc)
-
-        user.current_state = "IDLE_DROPPED"
-        user.plan_end_date = None
 
-        try:
-            db.commit()
-        except IntegrityError:
-            db.rollback()
-            logger.error(
-                "[FSM] Failed to auto-drop plan for user %s",
-                user_id,
-            )
-            return False
+            if active_plan:
+                step_rows = (
+                    db.query(AIPlanStep.id)
+                    .join(AIPlanDay, AIPlanDay.id == AIPlanStep.day_id)
+                    .filter(AIPlanDay.plan_id == active_plan.id)
+                    .all()
+                )
+                step_ids = [row[0] for row in step_rows]
+                active_plan.status = "abandoned"
+                active_plan.end_date = datetime.now(timezone.utc)
+
+            user.current_state = IDLE_DROPPED
+            user.plan_end_date = None
+    except IntegrityError:
+        logger.error(
+            "[FSM] Failed to auto-drop plan for user %s",
+            user_id,
+        )
+        return False
 
     if step_ids:
         cancel_plan_step_jobs(step_ids)
@@ -800,11 +844,13 @@ async def _commit_fsm_transition(
     """
 
     def _apply_transition(session: Session) -> Optional[str]:
-        user: Optional[User] = session.query(User).filter(User.id == user_id).first()
-        if not user:
+        row = session.execute(
+            select(User.current_state).where(User.id == user_id)
+        ).first()
+        if row is None:
             raise ValueError(f"User {user_id} not found")
 
-        previous_state = user.current_state
+        previous_state = row.current_state
         if previous_state == next_state:
             logger.debug(
                 "[FSM] No-op transition for user %s already in %s (agent=%s)",
@@ -819,8 +865,17 @@ async def _commit_fsm_transition(
                 f"Transition {previous_state} → {next_state} not allowed by FSM guards"
             )
 
-        user.current_state = next_state
-        session.add(user)
+        # Compare-and-swap: only move the row if nobody changed the state since we read it.
+        result = session.execute(
+            update(User)
+            .where(User.id == user_id, User.current_state == previous_state)
+            .values(current_state=next_state)
+            .execution_options(synchronize_session="evaluate")
+        )
+        if result.rowcount == 0:
+            raise ValueError(
+                f"Transition {previous_state} → {next_state} lost to a concurrent state change"
+            )
         logger.info(
             "[FSM] User %s state transition: %s → %s (agent=%s, reason=%s)",
             user_id,
@@ -845,9 +900,8 @@ async def _commit_fsm_transition(
         previous_state = _apply_transition(db)
         return previous_state
 
-    with SessionLocal() as managed_db:
+    with SessionLocal.begin() as managed_db:
         previous_state = _apply_transition(managed_db)
-        managed_db.commit()
 
     return previous_state
 
@@ -973,6 +1027,9 @@ def _persist_generated_plan(db: Session, user: User, plan_payload: Dict[str, Any
     )
 
     daily_time_slots = resolve_daily_time_slots(user.profile)
+    # plan_start / timezone / slot mapping are fixed for the whole plan, so each
+    # (day_number, time_slot) pair only needs to be resolved once.
+    scheduled_for_by_slot: Dict[Tuple[int, str], datetime] = {}
 
     for day in parsed_plan.schedule:
         day_record = AIPlanDay(
@@ -983,17 +1040,21 @@ def _persist_generated_plan(db: Session, user: User, plan_payload: Dict[str, Any
         db.add(day_record)
         db.flush()
         for index, step in enumerate(day.steps):
-            scheduled_for = compute_scheduled_for(
-                plan_start=plan_start,
-                day_number=day.day_number,
-                time_slot=step.time_slot,
-                timezone_name=user.timezone,
-                daily_time_slots=daily_time_slots,
-            )
+            slot_key = (day.day_number, step.time_slot)
+            scheduled_for = scheduled_for_by_slot.get(slot_key)
+            if scheduled_for is None:
+                scheduled_for = compute_scheduled_for(
+                    plan_start=plan_start,
+                    day_number=day.day_number,
+                    time_slot=step.time_slot,
+                    timezone_name=user.timezone,
+                    daily_time_slots=daily_time_slots,
+                )
+                scheduled_for_by_slot[slot_key] = scheduled_for
             step_type = step.step_type.value
-            assert step_type in {entry.value for entry in StepType}
+            assert step_type in _STEP_TYPE_VALUES
             difficulty = step.difficulty.value
-            assert difficulty in {entry.value for entry in DifficultyLevel}
+            assert difficulty in _DIFFICULTY_VALUES
             db.add(
                 AIPlanStep(
                     day_id=day_record.id,
@@ -1024,7 +1085,6 @@ def _persist_generated_plan(db: Session, user: User, plan_payload: Dict[str, Any
     log_metric(
         "plan_snapshot",
         extra={
-            "timestamp": datetime.utcnow().isoformat(),
             "user_id": user.id,
             "plan_summary": parsed_plan.title,
             "plan_key_parameters": {
@@ -1038,6 +1098,125 @@ def _persist_generated_plan(db: Session, user: User, plan_payload: Dict[str, Any
     return ai_plan
 
 
+def _persist_coach_plan_changes(
+    user_id: int,
+    generated_plan_object: Optional[Dict[str, Any]],
+    plan_updates: Optional[Dict[str, Any]],
+) -> Tuple[str, bool, Optional[PlanAdaptationResult]]:
+    """Persist a coach-generated plan and/or plan updates in one session and transaction.
+
+    The user is loaded once. Updates run inside a SAVEPOINT so a failed adaptation or
+    end-date write is rolled back on its own without discarding a freshly persisted plan.
+    Returns ``(outcome, plan_persisted, adaptation_result)`` where outcome is ``"ok"``,
+    ``"rejected"`` (generated plan failed validation) or ``"aborted"`` (reply immediately).
+    """
+    plan_persisted = False
+    adaptation_result: Optional[PlanAdaptationResult] = None
+    with SessionLocal() as db:
+        user: Optional[User] = db.get(User, user_id)
+        if not user:
+            logger.warning(
+                "[PLAN] Plan changes ignored — user %s not found (agent=coach)",
+                user_id,
+            )
+            return "aborted", False, None
+
+        if generated_plan_object is not None:
+            try:
+                _persist_generated_plan(db, user, generated_plan_object)
+                db.flush()
+            except (IntegrityError, PlanAgentEnvelopeError) as exc:
+                db.rollback()
+                logger.error(
+                    "[PLAN] Failed to persist generated plan for user %s (agent=coach)",
+                    user_id,
+                    exc_info=exc,
+                )
+                log_metric(
+                    "plan_validation_rejected",
+                    extra={"user_id": user_id, "agent": "coach"},
+                )
+                return "rejected", False, None
+            plan_persisted = True
+
+        if plan_updates is not None and "adaptation_type" in plan_updates:
+            active_plan = (
+                db.query(AIPlan)
+                .filter(AIPlan.user_id == user_id, AIPlan.status == "active")
+                .order_by(AIPlan.created_at.desc())
+                .first()
+            )
+            if not active_plan:
+                logger.warning(
+                    "[PLAN] Adaptation ignored — active plan missing (user=%s, agent=coach)",
+                    user_id,
+                )
+                db.commit()
+                return "aborted", plan_persisted, None
+            try:
+                with db.begin_nested():
+                    adaptation_result = apply_plan_adaptation(db, active_plan.id, plan_updates)
+            except (PlanAdaptationError, IntegrityError) as exc:
+                adaptation_result = None
+                logger.error(
+                    "[PLAN] Failed to apply adaptation for user %s (agent=coach): %s",
+                    user_id,
+                    exc,
+                )
+                log_metric(
+                    "plan_adaptation_failed",
+                    extra={
+                        "user_id": user_id,
+                        "agent": "coach",
+                        "adaptation_type": plan_updates.get("adaptation_type"),
+                    },
+                )
+            else:
+                log_metric(
+                    "plan_adaptation_applied",
+                    extra={
+                        "user_id": user_id,
+                        "agent": "coach",
+                        "adaptation_type": adaptation_result.adaptation_type,
+                        "scope": adaptation_result.scope,
+                        "step_diff_count": adaptation_result.step_diff_count,
+                    },
+                )
+        elif plan_updates is not None:
+            try:
+                with db.begin_nested():
+                    if "plan_end_date" in plan_updates:
+                        raw_end_date = plan_updates.get("plan_end_date")
+                        if raw_end_date:
+                            user.plan_end_date = datetime.fromisoformat(str(raw_end_date))
+                        else:
+                            user.plan_end_date = None
+            except (ValueError, IntegrityError):
+                logger.error(
+                    "[PLAN] Failed to persist updates for user %s (agent=coach)",
+                    user_id,
+                )
+            else:
+                logger.info(
+                    "[PLAN] User %s updated: end=%s",
+                    user_id,
+                    user.plan_end_date,
+                )
+
+        db.commit()
+
+    if plan_persisted:
+        logger.info(
+            "[PLAN] Generated plan persisted for user %s (agent=coach)",
+            user_id,
+        )
+        log_metric(
+            "plan_generated_ok",
+            extra={"user_id": user_id, "agent": "coach"},
+        )
+    return "ok", plan_persisted, adaptation_result
+
+
 async def get_stm_history(user_id: int) -> List[Dict[str, str]]:
     """Short-term memory with Redis primary and Postgres fallback."""
 
@@ -1068,7 +1247,10 @@ async def get_ltm_snapshot(user_id: int) -> Dict[str, Any]:
     """Long-term snapshot: поля профілю користувача."""
     with SessionLocal() as db:
         profile: Optional[UserProfile] = (
-            db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
+            db.query(UserProfile)
+            .options(joinedload(UserProfile.user))
+            .filter(UserProfile.user_id == user_id)
+            .first()
         )
 
         if profile:
@@ -1083,43 +1265,49 @@ async def get_ltm_snapshot(user_id: int) -> Dict[str, Any]:
     return {}
 
 
-async def get_temporal_context(user_id: int) -> Optional[str]:
+# Period of day by local hour: 05–11 Morning, 12–16 Afternoon, 17–21 Evening, else Night.
+_HOUR_PERIOD: Tuple[str, ...] = (
+    ("Night",) * 5 + ("Morning",) * 7 + ("Afternoon",) * 5 + ("Evening",) * 5 + ("Night",) * 2
+)
+
+
+def _load_user(user_id: int) -> Optional[User]:
     with SessionLocal() as db:
-        user: Optional[User] = db.query(User).filter(User.id == user_id).first()
+        return db.get(User, user_id)
+
 
+def _format_temporal_context(user: Optional[User]) -> Optional[str]:
     if not user:
         return None
 
     tz = _safe_timezone(user.timezone)
     localized_now = datetime.now(tz)
-    hour = localized_now.hour
-
-    if 5 <= hour < 12:
-        period = "Morning"
-    elif 12 <= hour < 17:
-        period = "Afternoon"
-    elif 17 <= hour < 22:
-        period = "Evening"
-    else:
-        period = "Night"
+    period = _HOUR_PERIOD[localized_now.hour]
+
+    return f"{localized_now.strftime('%A, %H:%M')} ({period})"
+
 
-    return f"{localized_now.strftime('%A')}, {localized_now.strftime('%H:%M')} ({period})"
+async def get_temporal_context(user_id: int) -> Optional[str]:
+    return _format_temporal_context(_load_user(user_id))
 
 
 async def get_fsm_state(user_id: int) -> Optional[str]:
     """Повертає поточний FSM-стан користувача."""
-    with SessionLocal() as db:
-        user: Optional[User] = db.query(User).filter(User.id == user_id).first()
-
+    user = _load_user(user_id)
     return user.current_state if user else None
 
 
 async def build_user_context(user_id: int, message_text: str) -> Dict[str, Any]:
-    stm_history = await get_stm_history(user_id)
-    fsm_state = await get_fsm_state(user_id)
-    temporal_context = await get_temporal_context(user_id)
-
-    schedule_adjustment_context = await session_memory.get_schedule_adjustment_context(user_id)
+    # One blocking User read serves both the FSM state and the temporal context;
+    # it runs in a worker thread so it overlaps the Redis reads instead of
+    # stalling the event loop.
+    stm_history, user, schedule_adjustment_context = await asyncio.gather(
+        get_stm_history(user_id),
+        asyncio.to_thread(_load_user, user_id),
+        session_memory.get_schedule_adjustment_context(user_id),
+    )
+    fsm_state = user.current_state if user else None
+    temporal_context = _format_temporal_context(user)
 
     return {
         "message_text": message_text,
@@ -1277,7 +1465,8 @@ async def _execute_plan_tool(user_id: int, tool_call: Dict[str, Any]) -> Optiona
         return None
 
     try:
-        result = handler(user_id, tool_args)
+        # Tools are synchronous (own session, plan build, job scheduling) — keep them off the loop.
+        result = await asyncio.to_thread(handler, user_id, tool_args)
         log_metric("plan_tool_executed", extra={"user_id": user_id, "tool": tool_name})
     except ValueError as exc:
         logger.warning("[TOOL] tool=%s user=%s failed: %s", tool_name, user_id, exc)
@@ -1307,7 +1496,9 @@ async def _execute_plan_tool(user_id: int, tool_call: Dict[str, Any]) -> Optiona
         if pending == "collect_evening_time_for_medium":
             registry = _build_tool_registry()
             try:
-                registry["create_followup_plan"](user_id, {"plan_type": "MEDIUM"})
+                await asyncio.to_thread(
+                    registry["create_followup_plan"], user_id, {"plan_type": "MEDIUM"}
+                )
                 log_metric("plan_tool_executed", extra={"user_id": user_id, "tool": "create_followup_plan"})
                 await session_memory.clear_pending_action(user_id)  # only after success
                 return _TOOL_REPLY_TEMPLATES["create_followup_plan"]
@@ -1320,6 +1511,12 @@ async def _execute_plan_tool(user_id: int, tool_call: Dict[str, Any]) -> Optiona
     return template
 
 
+def _build_agent_payload(
+    user_id: int, context_payload: Dict[str, Any], message_text: str
+) -> Dict[str, Any]:
+    return {"user_id": user_id, **context_payload, "message_text": message_text}
+
+
 async def handle_incoming_message(
     user_id: int,
     message_text: str,
@@ -1363,37 +1560,33 @@ async def handle_incoming_message(
     current_state = context_payload.get("current_state")
 
     if current_state == SCHEDULE_ADJUSTMENT:
-        await session_memory.set_schedule_adjustment_last_active(user_id)
-        await session_memory.clear_schedule_adjustment_soft_prompted(user_id)
+        await asyncio.gather(
+            session_memory.set_schedule_adjustment_last_active(user_id),
+            session_memory.clear_schedule_adjustment_soft_prompted(user_id),
+        )
 
     # Inject completion_context for IDLE_FINISHED state
-    if current_state == "IDLE_FINISHED":
+    if current_state == IDLE_FINISHED:
         with SessionLocal() as db:
             completion_context = _build_idle_finished_context(db, user_id)
         if completion_context is not None:
             context_payload["completion_context"] = completion_context
 
     # Onboarding path — state-based branch, not routing
-    if current_state == "IDLE_NEW" or (
-        isinstance(current_state, str) and current_state.startswith("ONBOARDING:")
+    if current_state == IDLE_NEW or (
+        isinstance(current_state, str) and current_state.startswith(ONBOARDING_PREFIX)
     ):
-        onboarding_payload = {
-            "user_id": user_id,
-            **context_payload,
-            "message_text": message_text,
-        }
-        onboarding_result = await mock_onboarding_agent(onboarding_payload)
-        return await _finalize_reply(str(onboarding_result.get("reply_text") or ""))
+        onboarding_result = await mock_onboarding_agent(
+            _build_agent_payload(user_id, context_payload, message_text)
+        )
+        return await _finalize_reply(_reply_text_of(onboarding_result))
 
     # All live-user states → coach_agent directly
-    coach_payload = {
-        "user_id": user_id,
-        **context_payload,
-        "message_text": message_text,
-    }
-    worker_result = await coach_agent(coach_payload)
+    worker_result = await coach_agent(
+        _build_agent_payload(user_id, context_payload, message_text)
+    )
 
-    reply_text = str(worker_result.get("reply_text") or "")
+    reply_text = _reply_text_of(worker_result)
     defer_draft = False
     plan_draft_parameters: Optional[Dict[str, Any]] = None
     show_plan_actions = False
@@ -1408,7 +1601,6 @@ async def handle_incoming_message(
         log_metric(
             "plan_agent_error",
             extra={
-                "timestamp": datetime.utcnow().isoformat(),
                 "user_id": user_id,
                 "agent": "coach",
                 "error": error_payload,
@@ -1432,50 +1624,15 @@ async def handle_incoming_message(
         if tool_result is not None:
             return await _finalize_reply(tool_result)
 
-    plan_persisted = False
     generated_plan_object = worker_result.get("generated_plan_object")
-    if generated_plan_object is not None:
-        with SessionLocal() as db:
-            user: Optional[User] = db.query(User).filter(User.id == user_id).first()
-            if not user:
-                logger.warning(
-                    "[PLAN] Generated plan ignored — user %s not found (agent=coach)",
-                    user_id,
-                )
-                return await _finalize_reply(reply_text)
-            try:
-                _persist_generated_plan(db, user, generated_plan_object)
-                db.commit()
-            except (IntegrityError, PlanAgentEnvelopeError) as exc:
-                db.rollback()
-                logger.error(
-                    "[PLAN] Failed to persist generated plan for user %s (agent=coach)",
-                    user_id,
-                    exc_info=exc,
-                )
-                log_metric(
-                    "plan_validation_rejected",
-                    extra={"user_id": user_id, "agent": "coach"},
-                )
-                fallback_text = _plan_agent_fallback_envelope().get("reply_text", "")
-                return await _finalize_reply(fallback_text)
-            else:
-                logger.info(
-                    "[PLAN] Generated plan persisted for user %s (agent=coach)",
-                    user_id,
-                )
-                plan_persisted = True
-                log_metric(
-                    "plan_generated_ok",
-                    extra={"user_id": user_id, "agent": "coach"},
-                )
-
     plan_updates = worker_result.get("plan_updates")
     transition_signal = worker_result.get("transition_signal")
+
+    apply_updates = False
+    stop_after_plan_changes = False
     if plan_updates and isinstance(plan_updates, dict):
-        allowed_execution_adaptations = {"pause", "resume", "PAUSE_PLAN", "RESUME_PLAN"}
         should_persist_updates = bool(generated_plan_object) or (
-            plan_updates.get("adaptation_type") in allowed_execution_adaptations
+            plan_updates.get("adaptation_type") in _ALLOWED_EXECUTION_ADAPTATIONS
         )
         if not should_persist_updates:
             logger.info(
@@ -1483,102 +1640,45 @@ async def handle_incoming_message(
                 user_id,
                 current_state,
             )
-        elif "adaptation_type" in plan_updates:
-            if plan_updates.get("adaptation_type") not in allowed_execution_adaptations:
-                logger.info(
-                    "[PLAN] Skipping non-execution adaptation type %s for user %s (agent=coach)",
-                    plan_updates.get("adaptation_type"),
-                    user_id,
-                )
-                return await _finalize_reply(reply_text)
-            adaptation_result = None
-            with SessionLocal() as db:
-                user: Optional[User] = db.query(User).filter(User.id == user_id).first()
-                if not user:
-                    logger.warning(
-                        "[PLAN] Adaptation ignored — user %s not found (agent=coach)",
-                        user_id,
-                    )
-                    return await _finalize_reply(reply_text)
-                active_plan = (
-                    db.query(AIPlan)
-                    .filter(AIPlan.user_id == user_id, AIPlan.status == "active")
-                    .order_by(AIPlan.created_at.desc())
-                    .first()
-                )
-                if not active_plan:
-                    logger.warning(
-                        "[PLAN] Adaptation ignored — active plan missing (user=%s, agent=coach)",
-                        user_id,
-                    )
-                    return await _finalize_reply(reply_text)
-                try:
-                    adaptation_result = apply_plan_adaptation(db, active_plan.id, plan_updates)
-                    db.commit()
-                except (PlanAdaptationError, IntegrityError) as exc:
-                    db.rollback()
-                    logger.error(
-                        "[PLAN] Failed to apply adaptation for user %s (agent=coach): %s",
-                        user_id,
-                        exc,
-                    )
-                    log_metric(
-                        "plan_adaptation_failed",
-                        extra={
-                            "user_id": user_id,
-                            "agent": "coach",
-                            "adaptation_type": plan_updates.get("adaptation_type"),
-                        },
-                    )
-                else:
-                    log_metric(
-                        "plan_adaptation_applied",
-                        extra={
-                            "user_id": user_id,
-                            "agent": "coach",
-                            "adaptation_type": adaptation_result.adaptation_type,
-                            "scope": adaptation_result.scope,
-                            "step_diff_count": adaptation_result.step_diff_count,
-                        },
-                    )
-            if adaptation_result:
-                if adaptation_result.canceled_step_ids:
-                    cancel_plan_step_jobs(adaptation_result.canceled_step_ids)
-                if adaptation_result.rescheduled_step_ids:
-                    reschedule_plan_steps(adaptation_result.rescheduled_step_ids)
+        elif (
+            "adaptation_type" in plan_updates
+            and plan_updates.get("adaptation_type") not in _ALLOWED_EXECUTION_ADAPTATIONS
+        ):
+            logger.info(
+                "[PLAN] Skipping non-execution adaptation type %s for user %s (agent=coach)",
+                plan_updates.get("adaptation_type"),
+                user_id,
+            )
+            stop_after_plan_changes = True
         else:
-            with SessionLocal() as db:
-                user: Optional[User] = db.query(User).filter(User.id == user_id).first()
-                if not user:
-                    logger.warning(
-                        "[PLAN] Updates ignored — user %s not found (agent=coach)",
-                        user_id,
-                    )
-                    return await _finalize_reply(reply_text)
-                try:
-                    if "plan_end_date" in plan_updates:
-                        raw_end_date = plan_updates.get("plan_end_date")
-                        if raw_end_date:
-                            user.plan_end_date = datetime.fromisoformat(str(raw_end_date))
-                        else:
-                            user.plan_end_date = None
-                    db.commit()
-                except (ValueError, IntegrityError):
-                    db.rollback()
-                    logger.error(
-                        "[PLAN] Failed to persist updates for user %s (agent=coach)",
-                        user_id,
-                    )
-                else:
-                    logger.info(
-                        "[PLAN] User %s updated: end=%s",
-                        user_id,
-                        user.plan_end_date,
-                    )
+            apply_updates = True
+
+    plan_persisted = False
+    if generated_plan_object is not None or apply_updates:
+        outcome, plan_persisted, adaptation_result = await asyncio.to_thread(
+            _persist_coach_plan_changes,
+            user_id,
+            generated_plan_object,
+            plan_updates if apply_updates else None,
+        )
+        if outcome == "rejected":
+            return await _finalize_reply(_reply_text_of(_plan_agent_fallback_envelope()))
+        if outcome == "aborted":
+            return await _finalize_reply(reply_text)
+        if adaptation_result and (
+            adaptation_result.canceled_step_ids or adaptation_result.rescheduled_step_ids
+        ):
+            await asyncio.to_thread(
+                mutate_plan_step_jobs,
+                adaptation_result.canceled_step_ids,
+                adaptation_result.rescheduled_step_ids,
+            )
+    if stop_after_plan_changes:
+        return await _finalize_reply(reply_text)
 
     # FSM guard enforced via _guard_fsm_transition/can_transition.
     next_state, rejection_reason = _guard_fsm_transition(
-        context_payload.get("current_state"),
+        current_state,
         transition_signal,
         "coach",
         plan_persisted=plan_persisted,
@@ -1595,7 +1695,7 @@ async def handle_incoming_message(
             extra={
                 "user_id": user_id,
                 "agent": "coach",
-                "current_state": context_payload.get("current_state"),
+                "current_state": current_state,
                 "transition_signal": transition_signal,
                 "reason": rejection_reason or "invalid_state",
             },
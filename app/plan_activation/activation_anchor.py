@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime, time, timedelta, timezone
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
 
 import pytz
 
@@ -10,6 +11,7 @@ from app.db import PlanDraftRecord
 from app.time_slots import normalize_time_slot
 
 
+@lru_cache(maxsize=512)
 def _normalize_timezone(name: str | None) -> pytz.BaseTzInfo:
     try:
         return pytz.timezone(name or "UTC")
@@ -19,11 +21,11 @@ def _normalize_timezone(name: str | None) -> pytz.BaseTzInfo:
 
 def _localize_datetime(
     *,
-    target_date: datetime,
+    target_date: date,
     target_time: time,
     tz: pytz.BaseTzInfo,
 ) -> datetime:
-    naive = datetime.combine(target_date.date(), target_time)
+    naive = datetime.combine(target_date, target_time)
     try:
         return tz.localize(naive)
     except pytz.NonExistentTimeError:
@@ -53,19 +55,22 @@ def resolve_activation_anchor_date(
     activation_time_utc = activation_time_utc.astimezone(timezone.utc)
     activation_local = activation_time_utc.astimezone(tz)
 
-    day1_slots = [
-        normalize_time_slot(step.time_slot)
-        for step in draft.steps or []
-        if step.day_number == 1
-    ]
-
+    activation_date = activation_local.date()
     should_shift = False
-    for slot in day1_slots:
+    # Walk steps lazily so the first past slot stops the scan; each slot is localized once.
+    seen_slots: set[str] = set()
+    for step in draft.steps or []:
+        if step.day_number != 1:
+            continue
+        slot = normalize_time_slot(step.time_slot)
+        if slot in seen_slots:
+            continue
+        seen_slots.add(slot)
         slot_time = slot_time_mapping.get(slot)
         if not slot_time:
             raise ValueError("invalid_time_slot")
         slot_dt = _localize_datetime(
-            target_date=activation_local,
+            target_date=activation_date,
             target_time=slot_time,
             tz=tz,
         )
@@ -75,7 +80,7 @@ def resolve_activation_anchor_date(
 
     anchor_date = activation_local + timedelta(days=1 if should_shift else 0)
     anchor_local = _localize_datetime(
-        target_date=anchor_date,
+        target_date=anchor_date.date(),
         target_time=time.min,
         tz=tz,
     )
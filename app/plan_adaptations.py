@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, Iterable, List, Optional, Tuple
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import update
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from app.db import AIPlan, AIPlanDay, AIPlanStep, AIPlanVersion
+from app.db import AIPlan, AIPlanDay, AIPlanStep, AIPlanVersion, User
 from app.telemetry import log_user_event
 from app.time_slots import (
     compute_scheduled_for,
@@ -23,6 +25,9 @@ _ADAPTATION_ALIASES = {
 }
 
 
+FutureStep = Tuple[AIPlanDay, AIPlanStep]
+
+
 class PlanAdaptationError(ValueError):
     """Raised when a plan adaptation payload is invalid or cannot be applied."""
 
@@ -53,25 +58,31 @@ def _parse_effective_from(raw_value: Any) -> datetime:
     return value.astimezone(timezone.utc)
 
 
-def _resolve_step_anchor(plan: AIPlan, day: AIPlanDay, step: AIPlanStep) -> datetime:
-    if step.scheduled_for:
-        return step.scheduled_for.astimezone(timezone.utc)
+def _plan_start_utc(plan: AIPlan) -> datetime:
     start_date = plan.start_date or datetime.now(timezone.utc)
     if start_date.tzinfo is None:
         start_date = start_date.replace(tzinfo=timezone.utc)
-    anchor = start_date + timedelta(days=max(day.day_number - 1, 0))
-    return anchor.astimezone(timezone.utc)
+    return start_date.astimezone(timezone.utc)
 
 
 def _iter_future_steps(
     plan: AIPlan,
     effective_from: datetime,
-) -> Iterable[Tuple[AIPlanDay, AIPlanStep]]:
+) -> Iterable[FutureStep]:
+    # A step is anchored at scheduled_for, else at its day's offset from the plan start,
+    # so the verdict for unscheduled steps is decided once per day. Days cannot be
+    # skipped wholesale: a scheduled_for may fall after its day anchor.
+    start_utc = _plan_start_utc(plan)
     for day in plan.days:
+        day_anchor = start_utc + timedelta(days=max(day.day_number - 1, 0))
+        day_is_future = day_anchor >= effective_from
         for step in day.steps:
             if step.step_status in ("completed", "skipped", "expired"):
                 continue
-            if _resolve_step_anchor(plan, day, step) >= effective_from:
+            if step.scheduled_for:
+                if step.scheduled_for.astimezone(timezone.utc) >= effective_from:
+                    yield day, step
+            elif day_is_future:
                 yield day, step
 
 
@@ -89,41 +100,81 @@ def _resolve_daily_target(params: Dict[str, Any], default_target: Optional[int])
 
 
 def _apply_reduce_load(
-    plan: AIPlan,
-    effective_from: datetime,
+    db: Session,
+    future_steps: List[FutureStep],
     params: Dict[str, Any],
 ) -> Tuple[int, List[int]]:
-    step_diff_count = 0
     skipped_step_ids: List[int] = []
-    for day in plan.days:
-        future_steps = [
-            step
-            for day_ref, step in _iter_future_steps(plan, effective_from)
-            if day_ref.id == day.id
-        ]
-        if not future_steps:
-            continue
-        target = _resolve_daily_target(params, None)
+    # One pass over the plan, bucketed by day. Steps keep the relationship's
+    # order_in_day ordering, so each bucket is already sorted.
+    future_steps_by_day: Dict[int, List[AIPlanStep]] = defaultdict(list)
+    for day, step in future_steps:
+        future_steps_by_day[day.id].append(step)
+    if not future_steps_by_day:
+        return 0, []
+    explicit_target = _resolve_daily_target(params, None)
+    for day_steps in future_steps_by_day.values():
+        target = explicit_target
         if target is None:
-            target = max(1, len(future_steps) - 1)
-        if len(future_steps) <= target:
+            target = max(1, len(day_steps) - 1)
+        if len(day_steps) <= target:
             continue
-        future_steps.sort(key=lambda step: step.order_in_day)
-        for step in future_steps[target:]:
-            step.step_status = "skipped"
-            step.skipped = True
-            step.scheduled_for = None
-            step_diff_count += 1
-            skipped_step_ids.append(step.id)
-    return step_diff_count, skipped_step_ids
+        skipped_step_ids.extend(step.id for step in day_steps[target:])
+    if skipped_step_ids:
+        # Every trimmed step gets the same values, so one UPDATE ... WHERE id IN replaces
+        # a per-row flush; "evaluate" keeps the loaded steps in sync.
+        db.execute(
+            update(AIPlanStep)
+            .where(AIPlanStep.id.in_(skipped_step_ids))
+            .values(step_status="skipped", skipped=True, scheduled_for=None)
+            .execution_options(synchronize_session="evaluate")
+        )
+    return len(skipped_step_ids), skipped_step_ids
+
+
+def _reschedule_future_steps(
+    plan: AIPlan,
+    effective_from: datetime,
+    future_steps: List[FutureStep],
+    time_slot: Optional[str] = None,
+) -> List[int]:
+    # Shared by shift_timing (every step moves to time_slot) and resume (each step keeps its own slot).
+    rescheduled_step_ids: List[int] = []
+    daily_time_slots = resolve_daily_time_slots(plan.user.profile if plan.user else None)
+    timezone_name = plan.user.timezone if plan.user else None
+    plan_start = plan.start_date or effective_from
+    # compute_scheduled_for depends only on these inputs; steps sharing them share a result.
+    scheduled_by_key: Dict[Tuple[date, int, str], datetime] = {}
+    for day, step in future_steps:
+        anchor_date = resolve_step_date(
+            plan_start=plan_start,
+            day_number=day.day_number,
+            scheduled_for=step.scheduled_for,
+            timezone_name=timezone_name,
+        )
+        step.time_slot = time_slot or normalize_time_slot(step.time_slot)
+        key = (anchor_date, day.day_number, step.time_slot)
+        scheduled_for = scheduled_by_key.get(key)
+        if scheduled_for is None:
+            scheduled_for = scheduled_by_key[key] = compute_scheduled_for(
+                plan_start=plan_start,
+                day_number=day.day_number,
+                time_slot=step.time_slot,
+                timezone_name=timezone_name,
+                daily_time_slots=daily_time_slots,
+                anchor_date=anchor_date,
+            )
+        step.scheduled_for = scheduled_for
+        rescheduled_step_ids.append(step.id)
+    return rescheduled_step_ids
 
 
 def _apply_shift_timing(
     plan: AIPlan,
     effective_from: datetime,
+    future_steps: List[FutureStep],
     params: Dict[str, Any],
 ) -> Tuple[int, List[int]]:
-    changed_step_ids: List[int] = []
     raw_time_slot = params.get("time_slot")
     if not raw_time_slot:
         return 0, []
@@ -131,60 +182,21 @@ def _apply_shift_timing(
         time_slot = normalize_time_slot(raw_time_slot)
     except ValueError as exc:
         raise PlanAdaptationError("invalid_time_slot") from exc
-    daily_time_slots = resolve_daily_time_slots(plan.user.profile if plan.user else None)
-    for day, step in _iter_future_steps(plan, effective_from):
-        plan_start = plan.start_date or effective_from
-        anchor_date = resolve_step_date(
-            plan_start=plan_start,
-            day_number=day.day_number,
-            scheduled_for=step.scheduled_for,
-            timezone_name=plan.user.timezone if plan.user else None,
-        )
-        step.time_slot = time_slot
-        step.scheduled_for = compute_scheduled_for(
-            plan_start=plan_start,
-            day_number=day.day_number,
-            time_slot=time_slot,
-            timezone_name=plan.user.timezone if plan.user else None,
-            daily_time_slots=daily_time_slots,
-            anchor_date=anchor_date,
-        )
-        changed_step_ids.append(step.id)
+    changed_step_ids = _reschedule_future_steps(plan, effective_from, future_steps, time_slot)
     return len(changed_step_ids), changed_step_ids
 
 
-def _apply_pause(
-    plan: AIPlan,
-    effective_from: datetime,
-) -> Tuple[int, List[int]]:
-    affected_steps = [step.id for _, step in _iter_future_steps(plan, effective_from)]
+def _apply_pause(future_steps: List[FutureStep]) -> Tuple[int, List[int]]:
+    affected_steps = [step.id for _, step in future_steps]
     return len(affected_steps), affected_steps
 
 
 def _apply_resume(
     plan: AIPlan,
     effective_from: datetime,
+    future_steps: List[FutureStep],
 ) -> Tuple[int, List[int]]:
-    rescheduled_step_ids: List[int] = []
-    daily_time_slots = resolve_daily_time_slots(plan.user.profile if plan.user else None)
-    for day, step in _iter_future_steps(plan, effective_from):
-        plan_start = plan.start_date or effective_from
-        anchor_date = resolve_step_date(
-            plan_start=plan_start,
-            day_number=day.day_number,
-            scheduled_for=step.scheduled_for,
-            timezone_name=plan.user.timezone if plan.user else None,
-        )
-        step.time_slot = normalize_time_slot(step.time_slot)
-        step.scheduled_for = compute_scheduled_for(
-            plan_start=plan_start,
-            day_number=day.day_number,
-            time_slot=step.time_slot,
-            timezone_name=plan.user.timezone if plan.user else None,
-            daily_time_slots=daily_time_slots,
-            anchor_date=anchor_date,
-        )
-        rescheduled_step_ids.append(step.id)
+    rescheduled_step_ids = _reschedule_future_steps(plan, effective_from, future_steps)
     return len(rescheduled_step_ids), rescheduled_step_ids
 
 
@@ -212,7 +224,11 @@ def apply_plan_adaptation(
 
     plan = (
         db.query(AIPlan)
-        .options(selectinload(AIPlan.days).selectinload(AIPlanDay.steps), selectinload(AIPlan.user))
+        .options(
+            # days/steps arrive ordered by the relationship order_by (day_number, order_in_day)
+            selectinload(AIPlan.days).selectinload(AIPlanDay.steps),
+            joinedload(AIPlan.user).joinedload(User.profile),
+        )
         .filter(AIPlan.id == plan_id)
         .first()
     )
@@ -223,14 +239,15 @@ def apply_plan_adaptation(
     canceled_step_ids: List[int] = []
     rescheduled_step_ids: List[int] = []
     scope = adaptation_type
+    future_steps = list(_iter_future_steps(plan, effective_from))
 
     if adaptation_type == "reduce_load":
-        step_diff_count, canceled_step_ids = _apply_reduce_load(plan, effective_from, params)
+        step_diff_count, canceled_step_ids = _apply_reduce_load(db, future_steps, params)
     elif adaptation_type == "shift_timing":
-        step_diff_count, rescheduled_step_ids = _apply_shift_timing(plan, effective_from, params)
+        step_diff_count, rescheduled_step_ids = _apply_shift_timing(plan, effective_from, future_steps, params)
         canceled_step_ids = list(rescheduled_step_ids)
     elif adaptation_type == "pause":
-        step_diff_count, canceled_step_ids = _apply_pause(plan, effective_from)
+        step_diff_count, canceled_step_ids = _apply_pause(future_steps)
         if plan.user:
             log_user_event(
                 db,
@@ -239,7 +256,7 @@ def apply_plan_adaptation(
                 context={"adaptation_type": adaptation_type, "effective_from": effective_from.isoformat()},
             )
     elif adaptation_type == "resume":
-        step_diff_count, rescheduled_step_ids = _apply_resume(plan, effective_from)
+        step_diff_count, rescheduled_step_ids = _apply_resume(plan, effective_from, future_steps)
         if plan.user:
             log_user_event(
                 db,
@@ -185,14 +185,6 @@ def build_completion_metrics(
             outcome_tier="WEAK",
         )
 
-    total_completed = sum(1 for s in eligible_steps if s.step_status == "completed")
-    total_skipped = sum(1 for s in eligible_steps if s.step_status == "skipped")
-    total_ignored = sum(1 for s in eligible_steps if s.step_status == "expired")
-    # Zero-division guard (total_delivered > 0 guaranteed by check above)
-    completion_rate = total_completed / total_delivered
-    engagement_rate = (total_completed + total_skipped) / total_delivered
-    silent_miss_rate = total_ignored / total_delivered
-
     # Streak by real calendar dates, respecting active_days gaps.
     user = plan.user
     active_days = resolve_active_days(getattr(user, "profile", None))
@@ -202,19 +194,30 @@ def build_completion_metrics(
     except Exception:
         user_tz = pytz.timezone("Europe/Kyiv")
 
-    completed_dates = [
-        s.scheduled_for.astimezone(user_tz).date()
-        for s in eligible_steps
-        if s.step_status == "completed" and s.scheduled_for
-    ]
-    best_streak = _compute_best_streak_by_date(completed_dates, active_days)
-    current_streak = _compute_current_streak(completed_dates, active_days)
-
+    # One pass collects status counts, completed dates and completed-slot counts.
+    status_counts: dict[str, int] = {}
+    completed_dates = []
     slot_counts: dict[str, int] = {}
     for s in eligible_steps:
-        if s.step_status != "completed" or not s.time_slot:
+        status = s.step_status
+        status_counts[status] = status_counts.get(status, 0) + 1
+        if status != "completed":
             continue
-        slot_counts[s.time_slot] = slot_counts.get(s.time_slot, 0) + 1
+        if s.scheduled_for:
+            completed_dates.append(s.scheduled_for.astimezone(user_tz).date())
+        if s.time_slot:
+            slot_counts[s.time_slot] = slot_counts.get(s.time_slot, 0) + 1
+
+    total_completed = status_counts.get("completed", 0)
+    total_skipped = status_counts.get("skipped", 0)
+    total_ignored = status_counts.get("expired", 0)
+    # Zero-division guard (total_delivered > 0 guaranteed by check above)
+    completion_rate = total_completed / total_delivered
+    engagement_rate = (total_completed + total_skipped) / total_delivered
+    silent_miss_rate = total_ignored / total_delivered
+
+    best_streak = _compute_best_streak_by_date(completed_dates, active_days)
+    current_streak = _compute_current_streak(completed_dates, active_days)
 
     dominant_time_slot: str | None = None
     if slot_counts:
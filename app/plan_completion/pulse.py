@@ -72,7 +72,8 @@ def _resolve_window(plan_total_days: int, active_day_number: int) -> tuple[int,
     return window_start, window_end
 
 
-def _resolve_persona(user: User) -> str:
+def resolve_persona(user: User) -> str:
+    """Coach persona for report/pulse copy; accepts dict or UserProfile profiles."""
     profile = getattr(user, "profile", None)
     if isinstance(profile, dict):
         return profile.get("persona", "empath")
@@ -135,7 +136,7 @@ def build_pulse_data(plan_id: int, db: Session) -> PulseData:
     window_done = sum(1 for entry in window_days if entry.completion_ratio > 0)
     window_total = len(window_days)
 
-    persona = _resolve_persona(user)
+    persona = resolve_persona(user)
     pool = PHRASES.get(persona, PHRASES["empath"])
     phrase_index = (plan_id + active_day_number) % len(pool)
     phrase = pool[phrase_index]
@@ -60,17 +60,26 @@ def get_plan_timeline(db: Session, user_id: int, plan_id: int) -> list[DayEntry]
     result: list[DayEntry] = []
 
     for day in days:
-        active = list(day.steps)
+        active = day.steps
         if not active:
             continue
-        ids = {s.id for s in active}
 
-        if all(s.scheduled_for and s.scheduled_for.replace(tzinfo=pytz.UTC) > now for s in active):
+        # One pass per day: future check and done/skipped tallies together.
+        all_future = True
+        n_done = 0
+        n_skipped = 0
+        for s in active:
+            if all_future and not (s.scheduled_for and s.scheduled_for.replace(tzinfo=pytz.UTC) > now):
+                all_future = False
+            if s.id in completed_ids:
+                n_done += 1
+            if s.id in skipped_ids:
+                n_skipped += 1
+
+        if all_future:
             result.append(DayEntry(day=day.day_number, status="future"))
             continue
 
-        n_done = len(ids & completed_ids)
-        n_skipped = len(ids & skipped_ids)
         n_total = len(active)
 
         if n_done == n_total:
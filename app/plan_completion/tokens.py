@@ -3,11 +3,23 @@
 import base64
 import hashlib
 import hmac
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4)
+def _keyed_hmac(secret: str) -> "hmac.HMAC":
+    # Keying (pad derivation + first block) happens once per secret; callers copy() the state.
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
+def _signature(plan_id: int, secret: str) -> bytes:
+    mac = _keyed_hmac(secret).copy()
+    mac.update(f"{plan_id}".encode())
+    return mac.digest()
 
 
 def make_report_token(plan_id: int, secret: str) -> str:
-    msg = f"{plan_id}".encode()
-    sig = hmac.new(secret.encode(), msg, hashlib.sha256).digest()
+    sig = _signature(plan_id, secret)
     raw = f"{plan_id}:".encode() + sig
     return base64.urlsafe_b64encode(raw).decode().rstrip("=")
 
@@ -19,7 +31,7 @@ def verify_report_token(token: str, secret: str) -> int | None:
         raw = base64.urlsafe_b64decode(padded)
         prefix, sig = raw[:-32], raw[-32:]
         plan_id = int(prefix.decode().rstrip(":"))
-        expected = hmac.new(secret.encode(), f"{plan_id}".encode(), hashlib.sha256).digest()
+        expected = _signature(plan_id, secret)
         if hmac.compare_digest(sig, expected):
             return plan_id
     except Exception:
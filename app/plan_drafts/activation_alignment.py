@@ -12,7 +12,7 @@ from app.db import PlanDraftStep
 from app.time_slots import normalize_time_slot
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlignmentPatch:
     id: object
     day_number: int
@@ -70,7 +70,7 @@ def align_draft_steps_to_activation_time(
     *,
     draft_steps: list[PlanDraftStep],
     activation_time: datetime,  # tz-aware UTC
-    timezone: str | None,
+    timezone_name: str | None,
     slot_time_mapping: dict[str, time],
 ) -> dict[str, object]:
     """
@@ -83,7 +83,7 @@ def align_draft_steps_to_activation_time(
     if not draft_steps:
         return {"patches": [], "start_day_offset_days": 0}
 
-    tz = _normalize_timezone(timezone)
+    tz = _normalize_timezone(timezone_name)
     slot_times = _build_slot_time_mapping(slot_time_mapping)
     day_one_slots = _unique_day_one_slots(draft_steps)
     if not day_one_slots:
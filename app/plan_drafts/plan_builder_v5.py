@@ -17,12 +17,14 @@ Critical invariants (product_internal_spec.md v2.0):
 
 from __future__ import annotations
 
+import heapq
 import json
 import random
 import uuid
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 import yaml
 
@@ -30,7 +32,7 @@ import yaml
 # ─── Data structures ────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExerciseV5:
     """Exercise from content library v5 schema."""
 
@@ -61,7 +63,7 @@ class ExerciseV5:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanStepV5:
     """Single scheduled step in a v5 plan draft."""
 
@@ -105,6 +107,38 @@ class MissingEveningSlotError(ValueError):
     """MEDIUM plan requires evening_time but none was provided (invariant 5)."""
 
 
+# ─── Library and recipe cache ────────────────────────────────────────────────
+
+
+@lru_cache(maxsize=4)
+def _read_library(
+    path: str, mtime: float
+) -> Tuple[Tuple[ExerciseV5, ...], Tuple[ExerciseV5, ...]]:
+    """
+    Parse the library once per (path, mtime). Returns (all, active) exercises.
+    Tuples keep the shared cached result immutable; mtime invalidates on edit.
+    """
+    # json.loads takes the raw bytes directly, skipping the text-mode decode layer.
+    data = json.loads(Path(path).read_bytes())
+    exercises = tuple(
+        ExerciseV5.from_library_item(item)
+        for item in data.get("inventory", [])
+    )
+    return exercises, tuple(e for e in exercises if e.is_active)
+
+
+@lru_cache(maxsize=4)
+def _read_recipe(path: str, mtime: float) -> dict:
+    """
+    Parse plan recipes once per (path, mtime), keeping only plan type keys.
+    The cached dict is shared between builders and must be treated as read-only.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        raw = yaml.safe_load(f)
+    # Strip YAML comments and return only plan type keys
+    return {k: v for k, v in raw.items() if isinstance(v, dict)}
+
+
 # ─── Builder ─────────────────────────────────────────────────────────────────
 
 
@@ -122,26 +156,32 @@ class PlanBuilderV5:
         library_path: str | Path,
         recipe_path: str | Path,
     ) -> None:
-        self.exercises: List[ExerciseV5] = self._load_library(Path(library_path))
+        self.exercises: List[ExerciseV5]
+        self._active: Tuple[ExerciseV5, ...]
+        self.exercises, self._active = self._load_library(Path(library_path))
+        self._pools: Dict[str, Tuple[ExerciseV5, ...]] = self._pools_by_mechanic(self._active)
         self.recipes: dict = self._load_recipe(Path(recipe_path))
 
     # ── Loading ──────────────────────────────────────────────────────────────
 
     @staticmethod
-    def _load_library(path: Path) -> List[ExerciseV5]:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        return [
-            ExerciseV5.from_library_item(item)
-            for item in data.get("inventory", [])
-        ]
+    def _load_library(path: Path) -> Tuple[List[ExerciseV5], Tuple[ExerciseV5, ...]]:
+        exercises, active = _read_library(str(path), path.stat().st_mtime)
+        return list(exercises), active
+
+    @staticmethod
+    def _pools_by_mechanic(
+        active: Sequence[ExerciseV5],
+    ) -> Dict[str, Tuple[ExerciseV5, ...]]:
+        """Group active exercises by mechanic, id-sorted once for seeded selection."""
+        pools: Dict[str, List[ExerciseV5]] = {}
+        for exercise in sorted(active, key=lambda e: e.id):
+            pools.setdefault(exercise.mechanic, []).append(exercise)
+        return {mechanic: tuple(pool) for mechanic, pool in pools.items()}
 
     @staticmethod
     def _load_recipe(path: Path) -> dict:
-        with path.open("r", encoding="utf-8") as f:
-            raw = yaml.safe_load(f)
-        # Strip YAML comments and return only plan type keys
-        return {k: v for k, v in raw.items() if isinstance(v, dict)}
+        return _read_recipe(str(path), path.stat().st_mtime)
 
     # ── Public API ───────────────────────────────────────────────────────────
 
@@ -185,45 +225,61 @@ class PlanBuilderV5:
         slot_configs: List[dict] = recipe["slots"]
 
         # Invariant 5: MEDIUM must have a valid EVENING HH:MM — no silent default
-        evening_slots = [s for s in slot_configs if s["slot"] == "EVENING"]
-        if evening_slots and not evening_time:
+        has_evening_slot = any(s["slot"] == "EVENING" for s in slot_configs)
+        if has_evening_slot and not evening_time:
             raise MissingEveningSlotError(
                 f"{plan_type} plan requires a valid evening_time "
                 f"(daily_time_slots['EVENING']) but none was provided."
             )
 
-        active = [e for e in self.exercises if e.is_active]
+        active = self._active
         if not active:
             raise NoCandidatesError("Content library has no active exercises")
 
-        last_used: Dict[str, int] = {}
+        # Cooldown state is updated incrementally: ids in `cooling` are excluded,
+        # and `expiries` releases each id on the first day it is usable again.
+        cooling: Set[str] = set()
+        expiries: List[Tuple[int, str]] = []
         steps: List[PlanStepV5] = []
 
-        for day in range(1, active_days_count + 1):
-            for slot_config in slot_configs:
-                slot: str = slot_config["slot"]                # "DAY" | "EVENING"
-                preferred: str = slot_config["preferred_mechanic"]
-                fallback: Optional[str] = slot_config.get("fallback_mechanic")
+        # The recipe is the same for every day: unpack each slot config once.
+        slot_plan: List[Tuple[str, str, Optional[str], str]] = [
+            (
+                slot_config["slot"],                     # "DAY" | "EVENING"
+                slot_config["preferred_mechanic"],
+                slot_config.get("fallback_mechanic"),
+                slot_config["slot"].lower(),
+            )
+            for slot_config in slot_configs
+        ]
+        # Loop-invariant lookups bound once rather than per slot.
+        pools = self._pools
+        pick_exercise = self._pick_exercise
 
-                exercise = self._pick_exercise(
-                    active=active,
+        for day in range(1, active_days_count + 1):
+            while expiries and expiries[0][0] <= day:
+                cooling.discard(heapq.heappop(expiries)[1])
+            for slot, preferred, fallback, slot_suffix in slot_plan:
+                exercise = pick_exercise(
+                    pools=pools,
                     preferred_mechanic=preferred,
                     fallback_mechanic=fallback,
-                    current_day=day,
-                    last_used=last_used,
+                    cooling=cooling,
                     seed_key=f"{user_id}:{day}:{slot}",
-                    context=f"plan_type={plan_type}, day={day}, slot={slot}",
+                    context=(plan_type, day, slot),
                 )
 
                 steps.append(PlanStepV5(
-                    step_id=f"d{day}_{slot.lower()}",
+                    step_id=f"d{day}_{slot_suffix}",
                     day_number=day,
                     time_slot=slot,
                     mechanic=exercise.mechanic,   # Invariant 6: snapshotted here
                     exercise_id=exercise.id,
                 ))
 
-                last_used[exercise.id] = day  # track cooldown
+                # Usable again once more than cooldown_days have passed
+                cooling.add(exercise.id)
+                heapq.heappush(expiries, (day + exercise.cooldown_days + 1, exercise.id))
 
         return PlanDraftV5(
             id=str(uuid.uuid4()),
@@ -241,62 +297,66 @@ class PlanBuilderV5:
 
     # ── Internal ─────────────────────────────────────────────────────────────
 
-    @staticmethod
-    def _is_in_cooldown(
-        exercise_id: str,
-        current_day: int,
-        cooldown_days: int,
-        last_used: Dict[str, int],
-    ) -> bool:
-        if exercise_id not in last_used:
-            return False
-        return (current_day - last_used[exercise_id]) <= cooldown_days
-
-    def _candidates(
-        self,
-        active: List[ExerciseV5],
-        mechanic: str,
-        current_day: int,
-        last_used: Dict[str, int],
-    ) -> List[ExerciseV5]:
-        return [
-            e for e in active
-            if e.mechanic == mechanic
-            and not self._is_in_cooldown(e.id, current_day, e.cooldown_days, last_used)
-        ]
-
     def _pick_exercise(
         self,
-        active: List[ExerciseV5],
+        pools: Dict[str, Tuple[ExerciseV5, ...]],
         preferred_mechanic: str,
         fallback_mechanic: Optional[str],
-        current_day: int,
-        last_used: Dict[str, int],
+        cooling: Set[str],
         seed_key: str,
-        context: str,
+        context: Tuple[str, int, str],
     ) -> ExerciseV5:
-        candidates = self._candidates(active, preferred_mechanic, current_day, last_used)
+        exercise = self._weighted_choice(pools.get(preferred_mechanic, ()), cooling, seed_key)
 
-        if not candidates and fallback_mechanic:
-            candidates = self._candidates(active, fallback_mechanic, current_day, last_used)
+        if exercise is None and fallback_mechanic:
+            exercise = self._weighted_choice(pools.get(fallback_mechanic, ()), cooling, seed_key)
 
-        if not candidates:
+        if exercise is None:
             # Invariants 4 & 5: MEDIUM must always find candidates — fail loudly
+            plan_type, day, slot = context
             raise NoCandidatesError(
-                f"No exercise available ({context}). "
+                f"No exercise available (plan_type={plan_type}, day={day}, slot={slot}). "
                 f"preferred={preferred_mechanic!r}, fallback={fallback_mechanic!r}. "
                 f"Library may be too small or all exercises are in cooldown."
             )
 
-        return self._weighted_choice(candidates, seed_key=seed_key)
+        return exercise
 
     @staticmethod
-    def _weighted_choice(exercises: List[ExerciseV5], seed_key: str = "") -> ExerciseV5:
-        """Seeded weighted random selection — same seed produces same result."""
-        pool = sorted(exercises, key=lambda e: e.id)  # deterministic sort before rng
-        weights = [e.weight for e in pool]
-        rng = random.Random(seed_key)
-        return rng.choices(pool, weights=weights, k=1)[0]
+    def _weighted_choice(
+        pool: Sequence[ExerciseV5],
+        cooling: Set[str],
+        seed_key: str = "",
+    ) -> Optional[ExerciseV5]:
+        """
+        Seeded weighted random selection over the pool entries not in cooldown.
+        Same seed produces same result; pool must be sorted by id (see _pools_by_mechanic).
+
+        Cooling entries are skipped in place instead of building a candidate list.
+        The draw mirrors random.choices (one random() scaled by the cumulative
+        weight, first cumulative weight above it wins), so results match it.
+        """
+        total = 0.0
+        eligible = 0
+        for exercise in pool:
+            if exercise.id not in cooling:
+                total += exercise.weight
+                eligible += 1
+        if not eligible:
+            return None
+        if total <= 0.0:
+            raise ValueError("Total of weights must be greater than zero")
+        threshold = random.Random(seed_key).random() * total
+        cumulative = 0.0
+        chosen: Optional[ExerciseV5] = None
+        for exercise in pool:
+            if exercise.id in cooling:
+                continue
+            cumulative += exercise.weight
+            chosen = exercise
+            if cumulative > threshold:
+                break
+        return chosen
 
 
 # ─── Default paths ───────────────────────────────────────────────────────────
@@ -312,6 +372,17 @@ DEFAULT_RECIPE_PATH: Path = (
 )
 
 
-def get_default_builder() -> PlanBuilderV5:
-    """Return a PlanBuilderV5 loaded from the default asset paths."""
+@lru_cache(maxsize=2)
+def _default_builder(library_mtime: float, recipe_mtime: float) -> PlanBuilderV5:
     return PlanBuilderV5(DEFAULT_LIBRARY_PATH, DEFAULT_RECIPE_PATH)
+
+
+def get_default_builder() -> PlanBuilderV5:
+    """
+    Return a PlanBuilderV5 loaded from the default asset paths.
+    build() keeps no state on the instance, so one builder is shared until either asset changes.
+    """
+    return _default_builder(
+        DEFAULT_LIBRARY_PATH.stat().st_mtime,
+        DEFAULT_RECIPE_PATH.stat().st_mtime,
+    )
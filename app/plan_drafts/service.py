@@ -13,6 +13,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.db import AIPlan, PlanDraftRecord, PlanDraftStep, UserProfile
@@ -144,19 +145,24 @@ def _persist_v5_draft(
     db.add(record)
     db.flush()
 
-    for step in draft.steps:
-        db.add(
-            PlanDraftStep(
-                draft_id=record.id,
-                day_number=step.day_number,
-                exercise_id=step.exercise_id,
-                time_slot=step.time_slot,
-                mechanic=step.mechanic,
-                # Legacy columns — not used in v5, set to safe defaults
-                slot_type="ACTION",
-                category="",
-                difficulty=None,
-            )
+    # One executemany INSERT for all step rows instead of a unit-of-work object per step.
+    if draft.steps:
+        db.execute(
+            insert(PlanDraftStep),
+            [
+                {
+                    "draft_id": record.id,
+                    "day_number": step.day_number,
+                    "exercise_id": step.exercise_id,
+                    "time_slot": step.time_slot,
+                    "mechanic": step.mechanic,
+                    # Legacy columns — not used in v5, set to safe defaults
+                    "slot_type": "ACTION",
+                    "category": "",
+                    "difficulty": None,
+                }
+                for step in draft.steps
+            ],
         )
 
     return record
@@ -7,6 +7,7 @@ from datetime import date, datetime, time, timedelta, timezone
 
 import logging
 import pytz
+from sqlalchemy import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, selectinload
 
@@ -88,13 +89,6 @@ def _normalize_timezone(name: str | None) -> pytz.BaseTzInfo:
         return pytz.UTC
 
 
-_FIXED_TIME_SLOTS: dict[str, time] = {
-    "MORNING": time(hour=9, minute=30),
-    "DAY": time(hour=14, minute=0),
-    "EVENING": time(hour=21, minute=0),
-}
-
-
 # _map_step_type and _map_difficulty removed in T5.2.
 # v5 plans: step_type is always ACTION, difficulty is always EASY.
 
@@ -128,6 +122,10 @@ def _derive_plan_end_date(plan_start: datetime, total_days: int, tz: pytz.BaseTz
 
 
 def _resolve_time_slot(value: str, slot_time_mapping: dict[str, time]) -> time:
+    # Draft steps already carry canonical slot names, so try them verbatim first.
+    slot_time = slot_time_mapping.get(value) if isinstance(value, str) else None
+    if slot_time:
+        return slot_time
     try:
         normalized = normalize_time_slot(value)
     except Exception as exc:
@@ -270,16 +268,17 @@ def finalize_plan(
             active_date_map[logical_day] = cursor
             cursor += timedelta(days=1)
 
-        day_records: dict[int, AIPlanDay] = {}
-        for day_number in range(1, locked_draft.total_days + 1):
-            day_record = AIPlanDay(
-                plan_id=plan.id,
-                day_number=day_number,
-                focus_theme=None,
+        # One multi-row INSERT for the days; RETURNING hands back the ids the steps need.
+        day_ids: dict[int, int] = {
+            row.day_number: row.id
+            for row in db.execute(
+                insert(AIPlanDay).returning(AIPlanDay.id, AIPlanDay.day_number),
+                [
+                    {"plan_id": plan.id, "day_number": day_number, "focus_theme": None}
+                    for day_number in range(1, locked_draft.total_days + 1)
+                ],
             )
-            db.add(day_record)
-            db.flush()
-            day_records[day_number] = day_record
+        }
 
         step_rows = list(locked_draft.steps or [])
         if not step_rows:
@@ -306,12 +305,13 @@ def finalize_plan(
 
         last_scheduled_for: datetime | None = None
         day_orders: dict[int, int] = defaultdict(int)
+        step_mappings: list[dict] = []
         for step_row in step_rows:
             day_number = int(step_row.day_number or 0)
             if day_number <= 0:
                 raise FinalizationError("invalid_day_number")
-            day_record = day_records.get(day_number)
-            if not day_record:
+            day_id = day_ids.get(day_number)
+            if day_id is None:
                 raise FinalizationError("day_not_found")
             exercise_id = str(step_row.exercise_id or "")
             content = content_entries.get(exercise_id)
@@ -345,25 +345,27 @@ def finalize_plan(
                 mechanic = "switch"
             order_in_day = day_orders[day_number]
             day_orders[day_number] += 1
-            db.add(
-                AIPlanStep(
-                    day_id=day_record.id,
-                    exercise_id=exercise_id,
-                    title=_build_step_title(content),
-                    description=_build_step_description(content),
-                    step_type=step_type,
-                    difficulty=difficulty,
-                    mechanic=mechanic,
-                    order_in_day=order_in_day,
-                    time_slot=time_slot,
-                    scheduled_for=scheduled_for,
-                    expires_at=expires,
-                    step_status="pending",
-                )
+            step_mappings.append(
+                {
+                    "day_id": day_id,
+                    "exercise_id": exercise_id,
+                    "title": _build_step_title(content),
+                    "description": _build_step_description(content),
+                    "step_type": step_type,
+                    "difficulty": difficulty,
+                    "mechanic": mechanic,
+                    "order_in_day": order_in_day,
+                    "time_slot": time_slot,
+                    "scheduled_for": scheduled_for,
+                    "expires_at": expires,
+                    "step_status": "pending",
+                }
             )
             if last_scheduled_for is None or scheduled_for > last_scheduled_for:
                 last_scheduled_for = scheduled_for
 
+        db.execute(insert(AIPlanStep), step_mappings)
+
         locked_draft.status = "FINALIZED"
 
         user.current_state = "ACTIVE"
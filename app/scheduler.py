@@ -325,50 +325,78 @@ def schedule_plan_step(step: AIPlanStep, user: User) -> bool:
     return new_job_id_assigned
 
 
+def _remove_step_jobs(db, step_ids: list[int]) -> int:
+    removed = 0
+    steps = (
+        db.query(AIPlanStep)
+        .filter(AIPlanStep.id.in_(step_ids))
+        .all()
+    )
+    for step in steps:
+        job_id = getattr(step, "job_id", None) or _generate_step_job_id(step)
+        try:
+            scheduler.remove_job(job_id)
+        except Exception:
+            continue
+        else:
+            removed += 1
+    return removed
+
+
+def _schedule_step_jobs(db, step_ids: list[int]) -> int:
+    created = 0
+    steps = (
+        db.query(AIPlanStep, AIPlanDay, AIPlan, User)
+        .join(AIPlanDay, AIPlanDay.id == AIPlanStep.day_id)
+        .join(AIPlan, AIPlan.id == AIPlanDay.plan_id)
+        .join(User, User.id == AIPlan.user_id)
+        .filter(AIPlanStep.id.in_(step_ids))
+        .all()
+    )
+    for step, _, plan, user in steps:
+        if plan.status != "active":
+            continue
+        if schedule_plan_step(step, user):
+            created += 1
+    return created
+
+
 def cancel_plan_step_jobs(step_ids: list[int]) -> int:
     if not step_ids:
         return 0
-    removed = 0
     with SessionLocal() as db:
-        steps = (
-            db.query(AIPlanStep)
-            .filter(AIPlanStep.id.in_(step_ids))
-            .all()
-        )
-        for step in steps:
-            job_id = getattr(step, "job_id", None) or _generate_step_job_id(step)
-            try:
-                scheduler.remove_job(job_id)
-            except Exception:
-                continue
-            else:
-                removed += 1
-    return removed
+        return _remove_step_jobs(db, step_ids)
 
 
 def reschedule_plan_steps(step_ids: list[int]) -> int:
     if not step_ids:
         return 0
-    created = 0
     with SessionLocal() as db:
-        steps = (
-            db.query(AIPlanStep, AIPlanDay, AIPlan, User)
-            .join(AIPlanDay, AIPlanDay.id == AIPlanStep.day_id)
-            .join(AIPlan, AIPlan.id == AIPlanDay.plan_id)
-            .join(User, User.id == AIPlan.user_id)
-            .filter(AIPlanStep.id.in_(step_ids))
-            .all()
-        )
-        for step, _, plan, user in steps:
-            if plan.status != "active":
-                continue
-            if schedule_plan_step(step, user):
-                created += 1
+        created = _schedule_step_jobs(db, step_ids)
         if created > 0:
             db.commit()
     return created
 
 
+def mutate_plan_step_jobs(canceled: list[int], rescheduled: list[int]) -> tuple[int, int]:
+    """
+    Cancel and reschedule step jobs in one pass over a single session.
+    Cancellation runs first so a step present in both lists ends up scheduled.
+    Returns (removed, created).
+    """
+    if not canceled and not rescheduled:
+        return 0, 0
+    removed = created = 0
+    with SessionLocal() as db:
+        if canceled:
+            removed = _remove_step_jobs(db, canceled)
+        if rescheduled:
+            created = _schedule_step_jobs(db, rescheduled)
+            if created > 0:
+                db.commit()
+    return removed, created
+
+
 async def schedule_daily_loop():
     """
     Restores jobs on startup.
@@ -811,9 +839,7 @@ async def _force_reset_schedule_adjustment(user: User, db) -> None:
     user.current_state = "ACTIVE_PAUSED" if plan_was_paused else "ACTIVE"
     db.add(user)
     db.commit()
-    await session_memory.clear_schedule_adjustment_context(user.id)
-    await session_memory.clear_schedule_adjustment_last_active(user.id)
-    await session_memory.clear_schedule_adjustment_soft_prompted(user.id)
+    await session_memory.clear_schedule_adjustment_session(user.id)
     logger.info("[SCHED_ADJ_TIMEOUT] Hard reset user=%s -> %s", user.id, user.current_state)
 
 
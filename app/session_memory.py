@@ -243,3 +243,17 @@ class SessionMemory:
             await self.redis.delete(self._schedule_adjustment_soft_prompted_key(user_id))
         except Exception:  # pragma: no cover - defensive
             logger.warning("Failed to clear schedule_adjustment_soft_prompted", exc_info=True)
+
+    async def clear_schedule_adjustment_session(self, user_id: int | None) -> None:
+        """Drop context, last-active and soft-prompt keys in a single DEL round-trip."""
+        if user_id is None or self.redis is None:
+            return
+
+        try:
+            await self.redis.delete(
+                self._schedule_adjustment_context_key(user_id),
+                self._schedule_adjustment_last_active_key(user_id),
+                self._schedule_adjustment_soft_prompted_key(user_id),
+            )
+        except Exception:  # pragma: no cover - defensive
+            logger.warning("Failed to clear schedule adjustment session", exc_info=True)
@@ -413,9 +413,7 @@ async def on_sched_adj_timeout(callback_query: CallbackQuery):
             user.current_state = "ACTIVE_PAUSED" if plan_was_paused else "ACTIVE"
             db.add(user)
             db.commit()
-            await session_memory.clear_schedule_adjustment_context(user.id)
-            await session_memory.clear_schedule_adjustment_last_active(user.id)
-            await session_memory.clear_schedule_adjustment_soft_prompted(user.id)
+            await session_memory.clear_schedule_adjustment_session(user.id)
             await callback_query.answer()
             if callback_query.message:
                 await callback_query.message.edit_reply_markup(reply_markup=None)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import re
 from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict, Iterable, Optional
 
 import pytz
@@ -11,6 +13,7 @@ from sqlalchemy.orm import Session, selectinload
 from app.db import AIPlan, AIPlanDay, AIPlanStep, User, UserProfile
 
 TIME_SLOTS = ("MORNING", "DAY", "EVENING")
+_TIME_SLOT_SET = frozenset(TIME_SLOTS)
 DEFAULT_DAILY_TIME_SLOTS: Dict[str, str] = {
     "MORNING": "09:30",
     "DAY": "14:00",
@@ -26,20 +29,30 @@ def normalize_time_slot(value: Any) -> str:
     if not isinstance(value, str):
         raise TimeSlotError("time_slot_not_string")
     normalized = value.strip().upper()
-    if normalized not in TIME_SLOTS:
+    if normalized not in _TIME_SLOT_SET:
         raise TimeSlotError("time_slot_invalid")
     return normalized
 
 
+_HHMM_RE = re.compile(r"(\d{1,2}):(\d{2})")
+
+
+@lru_cache(maxsize=256)
 def _parse_time(value: str) -> time:
-    parts = value.split(":", 1)
-    if len(parts) != 2:
-        raise TimeSlotError("invalid_time_format")
-    try:
-        hour = int(parts[0])
-        minute = int(parts[1])
-    except ValueError as exc:
-        raise TimeSlotError("invalid_time_format") from exc
+    # Canonical HH:MM takes the regex fast path; anything else goes through the
+    # lenient split/int parse so error codes and accepted inputs are unchanged.
+    match = _HHMM_RE.fullmatch(value)
+    if match:
+        hour, minute = int(match.group(1)), int(match.group(2))
+    else:
+        parts = value.split(":", 1)
+        if len(parts) != 2:
+            raise TimeSlotError("invalid_time_format")
+        try:
+            hour = int(parts[0])
+            minute = int(parts[1])
+        except ValueError as exc:
+            raise TimeSlotError("invalid_time_format") from exc
     if not (0 <= hour <= 23 and 0 <= minute <= 59):
         raise TimeSlotError("invalid_time_range")
     return time(hour=hour, minute=minute)
@@ -79,14 +92,30 @@ def normalize_daily_time_slots(raw: Any, *, require_all: bool) -> Dict[str, str]
     return normalized
 
 
+@lru_cache(maxsize=512)
+def _resolve_daily_time_slot_items(items: tuple) -> tuple:
+    # Keyed on the profile's slot content, so an edited profile simply misses the cache.
+    try:
+        return tuple(normalize_daily_time_slots(dict(items), require_all=False).items())
+    except TimeSlotError:
+        return tuple(DEFAULT_DAILY_TIME_SLOTS.items())
+
+
 def resolve_daily_time_slots(profile: Optional[UserProfile]) -> Dict[str, str]:
     raw = profile.daily_time_slots if profile else None
+    if isinstance(raw, dict):
+        try:
+            # Callers mutate the mapping, so each one gets a fresh dict.
+            return dict(_resolve_daily_time_slot_items(tuple(raw.items())))
+        except TypeError:
+            pass  # unhashable values: not cacheable, take the uncached path
     try:
         return normalize_daily_time_slots(raw, require_all=False)
     except TimeSlotError:
         return DEFAULT_DAILY_TIME_SLOTS.copy()
 
 
+@lru_cache(maxsize=128)
 def _normalize_timezone(name: Optional[str]) -> pytz.BaseTzInfo:
     try:
         return pytz.timezone(name or "UTC")
@@ -193,6 +193,23 @@ def test_report_valid_token_200_contains_completion_rate(monkeypatch):
     assert "50%" in resp.text
 
 
+def test_report_text_uses_profile_coach_persona(monkeypatch):
+    token = make_report_token(56, "secret")
+    monkeypatch.setattr(api.settings, "REPORT_TOKEN_SECRET", "secret")
+    user = SimpleNamespace(id=778, profile=SimpleNamespace(coach_persona="rationalist"))
+    monkeypatch.setattr(api, "SessionLocal", lambda: _ContextSession(_ApiDB(SimpleNamespace(id=56, user_id=778), user)))
+    monkeypatch.setattr(api, "build_completion_metrics", lambda *_: SimpleNamespace(completion_rate=0.5, total_days=21, best_streak=3, adaptation_count=1, dominant_time_slot="MORNING", focus="mixed", duration="STANDARD", outcome_tier="NEUTRAL"))
+    monkeypatch.setattr(api, "build_completion_report", lambda _metrics, persona: f"header-{persona}\nbody")
+    monkeypatch.setattr(api, "_pick_observation", lambda *_: "obs")
+    monkeypatch.setattr(api, "get_next_plan_recommendation", lambda *_: SimpleNamespace(button1_text="A", button2_text="B", button1_params={"duration": "SHORT", "load": "LITE", "focus": "mixed"}, button2_params={"duration": "MEDIUM", "load": "MID", "focus": "rest"}))
+    monkeypatch.setattr(api, "get_plan_timeline", lambda *_: [])
+
+    client = TestClient(api.app)
+    resp = client.get(f"/report/{token}")
+    assert resp.status_code == 200
+    assert "header-rationalist" in resp.text
+
+
 def test_report_invalid_token_404(monkeypatch):
     monkeypatch.setattr(api.settings, "REPORT_TOKEN_SECRET", "secret")
     client = TestClient(api.app)
@@ -259,3 +259,107 @@ def test_get_avg_difficulty_unknown_value_falls_back_to_one():
 
     assert result == 2
 
+
+
+def test_extract_exercise_ids_flattens_schedule():
+    payload = {
+        "schedule": [
+            {"steps": [{"exercise_id": "ex-1"}, {"exercise_id": None}]},
+            {"steps": [{"exercise_id": 42}]},
+        ]
+    }
+
+    assert orchestrator._extract_exercise_ids(payload) == ["ex-1", "42"]
+
+
+def test_extract_exercise_ids_malformed_payload_returns_empty():
+    assert orchestrator._extract_exercise_ids({}) == []
+    assert orchestrator._extract_exercise_ids({"schedule": [None]}) == []
+
+
+def test_extract_exercise_ids_skips_only_malformed_entries():
+    payload = {
+        "schedule": [
+            None,
+            {"steps": "bad"},
+            {"steps": ["bad", {"exercise_id": "ex-9"}]},
+        ]
+    }
+
+    assert orchestrator._extract_exercise_ids(payload) == ["ex-9"]
+
+
+def test_hour_period_table_matches_period_boundaries():
+    assert len(orchestrator._HOUR_PERIOD) == 24
+    assert orchestrator._HOUR_PERIOD[4] == "Night"
+    assert orchestrator._HOUR_PERIOD[5] == "Morning"
+    assert orchestrator._HOUR_PERIOD[11] == "Morning"
+    assert orchestrator._HOUR_PERIOD[12] == "Afternoon"
+    assert orchestrator._HOUR_PERIOD[17] == "Evening"
+    assert orchestrator._HOUR_PERIOD[21] == "Evening"
+    assert orchestrator._HOUR_PERIOD[22] == "Night"
+
+
+def test_execute_plan_tool_runs_handler_off_event_loop(monkeypatch):
+    import asyncio
+    import threading
+
+    calls = {}
+
+    def fake_pause_plan(user_id, _args):
+        calls["user_id"] = user_id
+        calls["thread"] = threading.current_thread()
+        return {"status": "ok"}
+
+    monkeypatch.setattr(orchestrator, "_build_tool_registry", lambda: {"pause_plan": fake_pause_plan})
+    monkeypatch.setattr(orchestrator, "log_metric", lambda *_args, **_kwargs: None)
+
+    reply = asyncio.run(orchestrator._execute_plan_tool(5, {"name": "pause_plan"}))
+
+    assert reply == orchestrator._TOOL_REPLY_TEMPLATES["pause_plan"]
+    assert calls["user_id"] == 5
+    assert calls["thread"] is not threading.main_thread()
+
+
+def test_guard_fsm_transition_outcomes():
+    guard = orchestrator._guard_fsm_transition
+
+    assert guard("ACTIVE", None, "coach") == (None, None)
+    assert guard("ACTIVE", {"state": "ACTIVE_PAUSED"}, "coach") == (None, "invalid_state")
+    assert guard("ACTIVE", "not_a_state", "coach") == (None, "invalid_state")
+    assert guard("ACTIVE", "active_paused", "coach") == ("ACTIVE_PAUSED", None)
+    assert guard("IDLE_NEW", "ACTIVE", "coach") == (None, "transition_blocked_by_guards")
+    assert guard(None, "ACTIVE", "coach") == ("ACTIVE", None)
+
+
+def test_build_user_context_reads_user_once_off_event_loop(monkeypatch):
+    import asyncio
+    import threading
+    from types import SimpleNamespace
+
+    threads = []
+
+    def fake_load_user(user_id):
+        threads.append(threading.current_thread())
+        return SimpleNamespace(current_state="ACTIVE", timezone="Europe/Kyiv")
+
+    async def fake_history(_user_id):
+        return []
+
+    async def fake_adjustment_context(_user_id):
+        return None
+
+    monkeypatch.setattr(orchestrator, "_load_user", fake_load_user)
+    monkeypatch.setattr(orchestrator, "get_stm_history", fake_history)
+    monkeypatch.setattr(
+        orchestrator.session_memory,
+        "get_schedule_adjustment_context",
+        fake_adjustment_context,
+    )
+
+    context = asyncio.run(orchestrator.build_user_context(3, "hi"))
+
+    assert context["current_state"] == "ACTIVE"
+    assert context["temporal_context"]
+    assert len(threads) == 1
+    assert threads[0] is not threading.main_thread()
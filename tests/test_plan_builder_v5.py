@@ -175,3 +175,13 @@ def test_deterministic_with_same_user_id(builder: PlanBuilderV5) -> None:
             f"{sa.exercise_id!r} vs {sb.exercise_id!r}"
         )
         assert sa.mechanic == sb.mechanic
+
+
+# ── T11: Library is parsed once and shared across builders ───────────────────
+
+
+def test_library_parse_is_cached_across_builders(builder: PlanBuilderV5) -> None:
+    other = PlanBuilderV5(LIBRARY_PATH, RECIPE_PATH)
+    assert other.exercises == builder.exercises
+    assert all(a is b for a, b in zip(other.exercises, builder.exercises))
+    assert other.recipes is builder.recipes
@@ -33,6 +33,9 @@ class _DummySessionMemory:
     async def update_schedule_adjustment_context(self, _user_id, updates):
         self.ctx.update(updates)
 
+    async def set_schedule_adjustment_context(self, _user_id, ctx):
+        self.ctx = ctx
+
     async def set_schedule_adjustment_last_active(self, _user_id):
         return None
 
@@ -45,6 +48,9 @@ class _DummySessionMemory:
     async def clear_schedule_adjustment_soft_prompted(self, _user_id):
         return None
 
+    async def clear_schedule_adjustment_session(self, _user_id):
+        return None
+
 
 class _DummyQuery:
     def __init__(self, row):
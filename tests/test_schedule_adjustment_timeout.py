@@ -50,6 +50,11 @@ class _DummySessionMemory:
     async def clear_schedule_adjustment_soft_prompted(self, _user_id):
         self.prompted = False
 
+    async def clear_schedule_adjustment_session(self, _user_id):
+        self.context = {}
+        self.last_active = None
+        self.prompted = False
+
 
 class _DummyDB:
     def __init__(self, users):